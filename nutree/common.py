@@ -346,6 +346,24 @@ def check_python_version(min_version: tuple[Union[str, int], Union[str, int]]) -
     return True
 
 
+def has_kind(node: Node) -> bool:
+    """Return true if `node` has a `kind` attribute (e.g. a `TypedNode`)."""
+    # Check the class, so plain nodes don't fall back to `Node.__getattr__()`
+    # (which may forward to `node.data`)
+    return hasattr(node.__class__, "kind")
+
+
+def normalize_before(before: Any) -> Any:
+    """Return the `before` argument of `add_child()` or `move_to()` with
+    ``False`` replaced by ``None`` (append).
+
+    Note that `False` would also match `isinstance(before, int)` checks.
+    """
+    if before is False:
+        return None
+    return before
+
+
 def call_mapper(fn: MapperCallbackType | None, node: Node, data: dict) -> Any:
     """Call the function and normalize result and exceptions.
 
@@ -398,37 +416,62 @@ def call_traversal_cb(
     - If a form of StopIteration is returned, we treat as StopTraversal, but
       emit a warning.
     - Other return values are ignored and converted to None.
+
+    Note: Traversal loops inline this: they call `fn()` directly and only
+    pass unusual results to :func:`check_traversal_result` or
+    :func:`check_traversal_exception`.
     """
     try:
         res = fn(node, memo)
+    except (SkipBranch, StopIteration) as e:
+        return check_traversal_exception(e, stacklevel=3)
+    if res is None:
+        return None
+    return check_traversal_result(res, stacklevel=3)
 
-        if res is None:
-            return None
-        elif res is SkipBranch or isinstance(res, SkipBranch):
-            return False
-        elif res is StopTraversal or isinstance(res, StopTraversal):
-            raise res
-        elif res is False:
-            raise StopTraversal
-        elif res is StopIteration or isinstance(res, StopIteration):
-            # Converts wrong syntax in exception handler...
-            raise res
-        else:
-            raise ValueError(
-                "callback should not return values except for "
-                f"None, False, SkipBranch, or StopTraversal: {res!r}."
-            )
-    except SkipBranch:
+
+def check_traversal_result(res: Any, stacklevel: int = 2) -> Literal[False] | None:
+    """Convert a value returned by a traversal callback (see
+    :func:`call_traversal_cb`).
+
+    `stacklevel` is passed to :func:`warnings.warn`, counted from the caller.
+    """
+    if res is None:
+        return None
+    elif res is SkipBranch or isinstance(res, SkipBranch):
         return False
-    except StopIteration as e:
-        # raise RuntimeError("Should raise StopTraversal instead")
-        warnings.warn(
-            "Should raise StopTraversal instead of StopIteration",
-            RuntimeWarning,
-            stacklevel=3,
-        )
-        raise StopTraversal(e.value) from e
-    return None
+    elif res is StopTraversal or isinstance(res, StopTraversal):
+        raise res
+    elif res is False:
+        raise StopTraversal
+    elif res is StopIteration:
+        return check_traversal_exception(res(), stacklevel + 1)
+    elif isinstance(res, StopIteration):
+        # Converts wrong syntax in exception handler...
+        return check_traversal_exception(res, stacklevel + 1)
+    raise ValueError(
+        "callback should not return values except for "
+        f"None, False, SkipBranch, or StopTraversal: {res!r}."
+    )
+
+
+def check_traversal_exception(
+    e: SkipBranch | StopIteration, stacklevel: int = 2
+) -> Literal[False]:
+    """Convert a SkipBranch or StopIteration raised (or returned) by a traversal
+    callback (see :func:`call_traversal_cb`).
+
+    `stacklevel` is passed to :func:`warnings.warn`, counted from the caller.
+    """
+    if isinstance(e, SkipBranch):
+        return False
+    # raise RuntimeError("Should raise StopTraversal instead")
+    warnings.warn(
+        "Should raise StopTraversal instead of StopIteration",
+        RuntimeWarning,
+        stacklevel=stacklevel + 1,
+    )
+    raise StopTraversal(e.value) from e
 
 
 @contextmanager
@@ -14,7 +14,7 @@ from pathlib import Path
 from subprocess import CalledProcessError, check_output
 from typing import IO, TYPE_CHECKING, Callable, Literal
 
-from nutree.common import DataIdType
+from nutree.common import DataIdType, has_kind
 
 if TYPE_CHECKING:  # Imported by type checkers, but prevent circular includes
     from nutree.node import Node
@@ -92,7 +92,7 @@ def _node_to_mermaid_flowchart_iter(
     elif edge_mapper is None:
 
         def edge_mapper(from_id, from_node, to_id, to_node):
-            kind = getattr(to_node, "kind", None)
+            kind = to_node.kind if has_kind(to_node) else None
             templ = DEFAULT_EDGE_TYPED if kind else DEFAULT_EDGE
             return templ.format(
                 from_id=from_id,
@@ -13,9 +13,13 @@ Declare the :class:`~nutree.node.Node` class.
 from __future__ import annotations
 
 import re
-from collections.abc import Iterable, Iterator
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from functools import lru_cache
+from itertools import chain, islice
 from operator import attrgetter
 from pathlib import Path
+from string import Formatter
 from typing import (
     IO,
     TYPE_CHECKING,
@@ -63,6 +67,9 @@ from nutree.common import (
     call_mapper,
     call_predicate,
     call_traversal_cb,
+    check_traversal_exception,
+    check_traversal_result,
+    normalize_before,
 )
 from nutree.dot import node_to_dot
 from nutree.rdf import RDFMapperCallbackType, node_to_rdf
@@ -71,6 +78,74 @@ TData = TypeVar("TData", bound="Any", default="Any")
 TNode = TypeVar("TNode", bound="Node", default="Node[TData]")
 
 
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, flags: int = 0) -> re.Pattern:
+    """Return a compiled regular expression (cached for repeated searches)."""
+    return re.compile(pattern, flags)
+
+
+_SIMPLE_REPR_FIELD = re.compile(r"node(?:\.[A-Za-z_]\w*)*")
+_SIMPLE_REPR_SPEC = re.compile(r"[\w<>=^+\-#,.% ]*")
+_REPR_CONVERSIONS = {None: None, "r": repr, "s": str, "a": ascii}
+
+
+def _compile_repr_field(
+    field: str, conv: Callable[[Any], str] | None, spec: str
+) -> Callable[[Node], str]:
+    """Return a function that renders one ``{node.attr!conv:spec}`` field."""
+    _, _, path = field.partition(".")
+    get = attrgetter(path) if path else None
+
+    def _field(node: Node) -> str:
+        val = get(node) if get else node
+        if conv:
+            val = conv(val)
+        return format(val, spec)
+
+    return _field
+
+
+@lru_cache(maxsize=64)
+def _compile_repr(template: str) -> Callable[[Node], str]:
+    """Return a function that renders `template` for a node.
+
+    `str.format()` parses the template again for every call. Templates that
+    only reference plain attributes of `node` (e.g. ``"{node.data!r}"``)
+    are split into literal text and attribute getters once instead.
+    Other templates fall back to ``template.format(node=node)``.
+    """
+
+    def _format(node: Node) -> str:
+        return template.format(node=node)
+
+    try:
+        parsed = list(Formatter().parse(template))
+    except ValueError:
+        return _format  # Raise the error when called, as before
+
+    parts: list[str | Callable[[Node], str]] = []
+    for literal, field, spec, conv in parsed:
+        if literal:
+            parts.append(literal)
+        if field is None:
+            continue
+        if (
+            not _SIMPLE_REPR_FIELD.fullmatch(field)
+            or not _SIMPLE_REPR_SPEC.fullmatch(spec)  # type: ignore
+            or conv not in _REPR_CONVERSIONS
+        ):
+            return _format
+        parts.append(_compile_repr_field(field, _REPR_CONVERSIONS[conv], spec))
+
+    if len(parts) == 1 and callable(parts[0]):
+        return parts[0]  # Single field, e.g. "{node.data!r}"
+
+    def _render(node: Node) -> str:
+        return "".join([p if p.__class__ is str else p(node) for p in parts])  # type: ignore
+
+    return _render
+
+
 # ------------------------------------------------------------------------------
 # - Node
 # ------------------------------------------------------------------------------
@@ -110,6 +185,7 @@ class Node(Generic[TData]):
         "_children",
         "_data_id",
         "_data",
+        "_depth",
         "_meta",
         "_node_id",
         "_parent",
@@ -134,13 +210,14 @@ class Node(Generic[TData]):
     ):
         self._data: TData = data
         self._parent: Self = parent
+        self._depth: int = parent._depth + 1
 
         tree = parent._tree
         self._tree: Tree[Self] = tree
         self._children: list[Self] | None = None
 
         if data_id is None:
-            self._data_id: DataIdType = tree.calc_data_id(data)
+            self._data_id: DataIdType = tree._calc_data_id(data)
         else:
             self._data_id = data_id
 
@@ -151,7 +228,7 @@ class Node(Generic[TData]):
 
         self._meta = meta
 
-        tree._register(self)  # type: ignore
+        tree._register_bound(self)  # type: ignore
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}<{self.name!r}, data_id={self.data_id}>"
@@ -190,7 +267,9 @@ class Node(Generic[TData]):
     @property
     def name(self) -> str:
         """String representation of the embedded `data` object."""
-        return f"{self.data}"
+        data = self._data
+        # Plain strings are returned as-is (`f"{data}"` would call `format()`)
+        return data if data.__class__ is str else f"{data}"
 
     @property
     def path(self) -> str:
@@ -413,10 +492,16 @@ class Node(Generic[TData]):
         return self._children[-1] if self._children else None
 
     def get_siblings(self, *, add_self=False) -> list[Self]:
-        """Return a list of all sibling entries of self (excluding self) if any."""
+        """Return a list of all sibling entries of self (excluding self) if any.
+
+        The result is always a new list, so modifying it does not change the
+        parent's children.
+        """
+        siblings = self._parent._children
         if add_self:
-            return self._parent._children  # type: ignore
-        return [n for n in self._parent._children if n is not self]  # type: ignore
+            return siblings.copy()  # type: ignore
+        idx = self._sibling_index()
+        return siblings[:idx] + siblings[idx + 1 :]  # type: ignore
 
     def first_sibling(self) -> Self:
         """Return first sibling (may be self)."""
@@ -424,17 +509,17 @@ class Node(Generic[TData]):
 
     def prev_sibling(self) -> Self | None:
         """Predecessor or None, if node is first sibling."""
-        if self.is_first_sibling():
+        pc = self._parent._children
+        if self is pc[0]:  # type: ignore
             return None
-        idx = self._parent._children.index(self)  # type: ignore
-        return self._parent._children[idx - 1]  # type: ignore
+        return pc[self._sibling_index() - 1]  # type: ignore
 
     def next_sibling(self) -> Self | None:
         """Return successor or None, if node is last sibling."""
-        if self.is_last_sibling():
+        pc = self._parent._children
+        if self is pc[-1]:  # type: ignore
             return None
-        idx = self._parent._children.index(self)  # type: ignore
-        return self._parent._children[idx + 1]  # type: ignore
+        return pc[self._sibling_index() + 1]  # type: ignore
 
     def last_sibling(self) -> Self:
         """Return last node, that share own parent (may be `self`)."""
@@ -445,49 +530,76 @@ class Node(Generic[TData]):
         clones = cast(list[Self], self._tree._nodes_by_data_id[self._data_id])
         if add_self:
             return clones.copy()
-        return [n for n in clones if n is not self]
+        # Note: `clones.index(self)` would compare with `==`, which is true for
+        # all clones, so we search by identity and slice (in C) instead:
+        for idx, n in enumerate(clones):
+            if n is self:
+                return clones[:idx] + clones[idx + 1 :]
+        return clones.copy()  # pragma: no cover
 
     def depth(self) -> int:
         """Return the distance to the root node (1 for toplevel nodes)."""
-        return self.calc_depth()
+        return self._depth
 
     def count_descendants(self, *, leaves_only=False) -> int:
         """Return number of descendant nodes, not counting self."""
-        all = not leaves_only
+        # Walk the child lists only (not the nodes), so we can add whole
+        # sibling lists with `len()` when counting all descendants.
         i = 0
-        for node in self.iterator():
-            if all or not node._children:
-                i += 1
+        stack = [self._children]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            children = pop()
+            if not children:
+                continue
+            if not leaves_only:
+                i += len(children)
+            for n in children:
+                c = n._children
+                if c:
+                    push(c)
+                elif leaves_only:
+                    i += 1
         return i
 
     def calc_depth(self) -> int:
         """Return the distance to the root node (1 for toplevel nodes)."""
-        depth = 0
-        pe = self._parent
-        while pe is not None:
-            depth += 1
-            pe = pe._parent
-        return depth
+        # Maintained by `__init__()` and `move_to()`
+        return self._depth
 
     def calc_height(self) -> int:
         """Return the maximum depth of all descendants (0 for leaves)."""
+        # Non-recursive: we keep a stack of (node, relative depth) pairs
         height = 0
-
-        def _ch(n: Self, h: int) -> None:
-            nonlocal height
+        stack = [(self, 0)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            n, h = pop()
             c = n._children
             if c:
+                h += 1
                 for n in c:
-                    _ch(n, h + 1)
+                    push((n, h))
             elif h > height:
                 height = h
-
-        _ch(self, 0)
         return height
 
     def get_index(self) -> int:
         """Return index in sibling list."""
-        return self._parent._children.index(self)  # type: ignore
+        return self._sibling_index()
+
+    def _sibling_index(self) -> int:
+        """Return the position of `self` in the parent's child list.
+
+        Unlike ``list.index()``, this compares by identity, so it does not call
+        :meth:`__eq__` (and thereby the data's ``__eq__``) for every sibling.
+        """
+        for idx, n in enumerate(self._parent._children):  # type: ignore
+            if n is self:
+                return idx
+        raise ValueError(f"{self} is not a child of {self._parent}")
 
     # --------------------------------------------------------------------------
 
@@ -506,7 +618,8 @@ class Node(Generic[TData]):
 
     def is_clone(self) -> bool:
         """Return true if this node's data is referenced at least one more time."""
-        return bool(len(self._tree._nodes_by_data_id.get(self._data_id)) > 1)  # type: ignore
+        clones = self._tree._nodes_by_data_id.get(self._data_id)
+        return clones is not None and len(clones) > 1
 
     def is_first_sibling(self) -> bool:
         """Return true if this node is the first sibling, i.e. the first child
@@ -524,19 +637,24 @@ class Node(Generic[TData]):
 
     def get_top(self) -> Self:
         """Return toplevel ancestor (may be self)."""
+        # We know the distance from the cached depth
         root = self
-        while root._parent._parent:
+        for _ in range(self._depth - 1):
             root = root._parent
         return root
 
     def is_descendant_of(self, other: Self) -> bool:
         """Return true if this node is direct or indirect child of `other`."""
-        parent = self._parent
-        while parent is not None and parent._parent is not None:
-            if parent is other:
-                return True
+        if self._parent is None or other._parent is None:
+            return False  # System root (or removed node)
+        # An ancestor must be higher up, and is exactly `diff` levels above us
+        diff = self._depth - other._depth
+        if diff <= 0:
+            return False
+        parent = self
+        for _ in range(diff):
             parent = parent._parent
-        return False
+        return parent is other
 
     def is_ancestor_of(self, other: Self) -> bool:
         """Return true if this node is a parent, grandparent, ... of `other`."""
@@ -544,32 +662,63 @@ class Node(Generic[TData]):
 
     def get_common_ancestor(self, other: Self) -> Self | None:
         """Return the nearest node that contains `self` and `other` (may be None)."""
-        if self._tree is other._tree:
-            other_parent_set = {
-                n._node_id for n in other.get_parent_list(add_self=True)
-            }
-            for parent in self.get_parent_list(add_self=True, bottom_up=True):
-                if parent._node_id in other_parent_set:
-                    return parent
-        return None
+        if self._tree is not other._tree:
+            return None
+        if self._parent is None or other._parent is None:
+            return None  # System root (or removed node)
+        # Climb the deeper node up to the same level, then walk up both
+        # branches in lockstep until they meet.
+        a, b = self, other
+        diff = a._depth - b._depth
+        for _ in range(diff):
+            a = a._parent
+        for _ in range(-diff):
+            b = b._parent
+        while a is not b:
+            a = a._parent
+            b = b._parent
+        # Toplevel nodes only have the system root in common
+        return a if a._parent is not None else None
 
     def get_parent_list(self, *, add_self=False, bottom_up=False) -> list[Self]:
         """Return ordered list of all parent nodes."""
-        res = []
         parent = self if add_self else self._parent
-        while parent is not None and parent._parent is not None:
-            res.append(parent)
+        if parent is None or parent._parent is None:
+            return []  # System root (or removed node)
+        if bottom_up:
+            res = []
+            while parent._parent is not None:
+                res.append(parent)
+                parent = parent._parent
+            return res
+        # We know the number of ancestors, so fill a preallocated list
+        # top-down instead of appending and reversing
+        i = parent._depth
+        res = [parent] * i
+        while i > 1:
+            i -= 1
             parent = parent._parent
-        if not bottom_up:
-            res.reverse()
+            res[i - 1] = parent
         return res
 
     def get_path(
         self, *, add_self: bool = True, separator: str = "/", repr: str = "{node.name}"
     ) -> str:
         """Return a breadcrumb string, e.g. '/A/a1/a12'."""
-        res = (repr.format(node=p) for p in self.get_parent_list(add_self=add_self))
-        return separator + separator.join(res)
+        # Use a precompiled template instead of parsing it for every level
+        fmt = _compile_repr(repr)
+        p = self if add_self else self._parent
+        if p is None or p._parent is None:
+            return separator  # System root (or removed node)
+        # Format the parts while walking up, filling a preallocated list
+        # top-down (see `get_parent_list()`)
+        i = p._depth
+        parts = [""] * i
+        while i:
+            i -= 1
+            parts[i] = fmt(p)
+            p = p._parent
+        return separator + separator.join(parts)
 
     # --------------------------------------------------------------------------
 
@@ -630,52 +779,117 @@ class Node(Generic[TData]):
         Returns:
             the new :class:`~nutree.node.Node` instance
         """
+        before = normalize_before(before)
+
+        if isinstance(child, Node):
+            return self._add_child_node(
+                cast(Self, child),
+                before=before,
+                deep=deep,
+                data_id=data_id,
+                node_id=node_id,
+            )
+
         if isinstance(child, self._tree.__class__):
             if deep is None:
                 deep = True
-            topnodes = cast(list[Self], child.system_root.children)
-            if isinstance(before, (int, Node)) or before is True:
-                topnodes.reverse()
-            n = None
-            for n in topnodes:
-                self.add_child(n, before=before, deep=deep)
-            return cast(Self, n)
-
-        factory = self.tree.node_factory
-        source_node: Self = None  # type: ignore
-        new_node: Self = None  # type: ignore
+            return self._add_tree(
+                child,
+                before=before,
+                deep=deep,
+                add_node=lambda n: self._add_child_node(
+                    n, before=before, deep=deep, data_id=None, node_id=None
+                ),
+            )  # type: ignore
+
+        if before is None:
+            return self._append_data(child, data_id=data_id, node_id=node_id)
+        return self._add_child_data(
+            child, before=before, data_id=data_id, node_id=node_id
+        )
 
-        if isinstance(child, Node):
-            assert isinstance(child, self.tree.node_factory)
-            # Adding an existing node means that we create a clone
-            if deep is None:
-                deep = False
-            if deep and data_id is not None or node_id is not None:
-                raise ValueError("Cannot set ID for deep copies.")
-
-            source_node = cast(Self, child)
-            if source_node._tree is self._tree:
-                if source_node._parent is self:
-                    raise UniqueConstraintError(
-                        f"Cannot add a copy of {source_node} as child of {self}, "
-                        "because it would create a 2nd instance in the same parent."
-                    )
-            else:
-                pass
+    def _add_tree(
+        self,
+        tree: Tree,
+        *,
+        before: Self | bool | int | None,
+        deep: bool,
+        add_node: Callable[[Self], Self],
+    ) -> Self | None:
+        """Add copies of all toplevel nodes of `tree` (see :meth:`add_child`).
 
-            if data_id and data_id != source_node._data_id:
-                raise UniqueConstraintError(f"data_id conflict: {source_node}")
+        `add_node(source_node)` is called to add a single toplevel node.
+        Return the last node that was added (None if `tree` is empty).
+        """
+        topnodes = cast(list[Self], tree.system_root._children)
+        if not topnodes:
+            return None
+        if deep and before is None and tree is not self._tree:
+            # Append deep copies of all toplevel nodes in one iterative pass
+            self._add_from(cast(Self, tree.system_root))
+            return self._children[-1]  # type: ignore
+        if isinstance(before, (int, Node)) or before is True:
+            # Insert in reverse order (don't reverse the source tree in-place)
+            topnodes = topnodes[::-1]
+        n = None
+        for n in topnodes:
+            add_node(n)
+        return n
+
+    def _add_child_node(
+        self,
+        source_node: Self,
+        *,
+        before: Self | bool | int | None,
+        deep: bool | None,
+        data_id: DataIdType | None,
+        node_id,
+    ) -> Self:
+        """Add a copy of an existing node (see :meth:`add_child`)."""
+        assert isinstance(source_node, self._tree.node_factory)
+        # Adding an existing node means that we create a clone
+        if deep is None:
+            deep = False
+        if deep and data_id is not None or node_id is not None:
+            raise ValueError("Cannot set ID for deep copies.")
+
+        if source_node._tree is self._tree and source_node._parent is self:
+            raise UniqueConstraintError(
+                f"Cannot add a copy of {source_node} as child of {self}, "
+                "because it would create a 2nd instance in the same parent."
+            )
+
+        if data_id and data_id != source_node._data_id:
+            raise UniqueConstraintError(f"data_id conflict: {source_node}")
 
-            new_node = factory(
-                source_node.data,  # type: ignore
+        if deep and (self is source_node or self.is_descendant_of(source_node)):
+            raise ValueError(f"Cannot add a deep copy of {source_node} to itself.")
+
+        new_node = self._add_child_data(
+            source_node._data, before=before, data_id=data_id, node_id=node_id
+        )
+        if deep:
+            new_node._add_from(source_node)
+        return new_node
+
+    def _add_child_data(
+        self,
+        data: TData,
+        *,
+        before: Self | bool | int | None,
+        data_id: DataIdType | None,
+        node_id,
+    ) -> Self:
+        """Create a new node for `data` and insert it (see :meth:`add_child`)."""
+        new_node = cast(
+            Self,
+            self._tree.node_factory(
+                data,
                 parent=self,  # type: ignore
                 data_id=data_id,
                 node_id=node_id,
-            )
-        else:
-            new_node = factory(child, parent=self, data_id=data_id, node_id=node_id)  # type: ignore
-
-        new_node = cast(Self, new_node)
+            ),
+        )
 
         if before is True:
             before = 0  # prepend
@@ -692,16 +906,27 @@ class Node(Generic[TData]):
                     f"`before=node` ({before._parent}) "
                     f"must be a child of target node ({self})"
                 )
-            idx = children.index(before)  # raises ValueError
-            children.insert(idx, new_node)
+            children.insert(before._sibling_index(), new_node)
         else:
             children.append(new_node)
 
-        if deep and source_node:
-            new_node._add_from(source_node)
-
         return new_node
 
+    def _append_data(self, data: TData, *, data_id: DataIdType | None, node_id) -> Self:
+        """Create a new node for `data` and append it (fast path, no checks)."""
+        new_node = self._tree.node_factory(
+            data,
+            parent=self,  # type: ignore
+            data_id=data_id,
+            node_id=node_id,
+        )
+        children = self._children
+        if children is None:
+            self._children = [new_node]
+        else:
+            children.append(new_node)
+        return new_node  # type: ignore
+
     #: Alias for :meth:`add_child`
     add = add_child
 
@@ -796,11 +1021,21 @@ class Node(Generic[TData]):
         if new_parent.tree is not self.tree:
             raise NotImplementedError("Can only move nodes inside same tree")
 
-        self._parent._children.remove(self)  # type: ignore
-        if not self._parent._children:  # store None instead of `[]`
+        # Find by identity (`list.remove()` would compare data with `==`)
+        pc = self._parent._children
+        del pc[self._sibling_index()]  # type: ignore
+        if not pc:  # store None instead of `[]`
             self._parent._children = None
         self._parent = cast(Self, new_parent)
 
+        # Update the cached depth of the moved branch
+        delta = new_parent._depth + 1 - self._depth
+        if delta:
+            self._depth += delta
+            for n in self._iter_pre():
+                n._depth += delta
+
+        before = normalize_before(before)
         if before is True:
             before = 0  # prepend
 
@@ -810,8 +1045,7 @@ class Node(Generic[TData]):
             new_parent._children = [self]
         elif isinstance(before, Node):
             assert before._parent is new_parent, before
-            idx = target_siblings.index(before)  # raise ValueError if not found
-            target_siblings.insert(idx, self)
+            target_siblings.insert(before._sibling_index(), self)
         elif isinstance(before, int):
             target_siblings.insert(before, self)
         else:
@@ -833,24 +1067,33 @@ class Node(Generic[TData]):
                 c.remove(keep_children=keep_children, with_clones=False)
             assert not self.is_clone()
 
-        if keep_children:
-            for c in self.children.copy():
-                c.move_to(self._parent, before=self)
-        else:
-            self.remove_children()
+        parent = self._parent
+        pc = parent._children
+        # Find by identity (`list.remove()` would compare data with `==`)
+        idx = self._sibling_index()
 
-        pc = self._parent._children
-        pc.remove(self)  # type: ignore
-        if not pc:  # store None instead of `[]`
-            pc = self._parent._children = None
+        children = self._children
+        if keep_children and children:
+            # Move all children one level up and splice them into our slot
+            for n in self._iter_pre():
+                n._depth -= 1
+            for c in children:
+                c._parent = parent
+            pc[idx : idx + 1] = children  # type: ignore
+            self._children = None
+        else:
+            if not keep_children:
+                self.remove_children()
+            del pc[idx]  # type: ignore
+            if not pc:  # store None instead of `[]`
+                parent._children = None
 
         self._tree._unregister(self)  # type: ignore
 
     def remove_children(self) -> None:
         """Remove all children of this node, making it a leaf node."""
-        _unregister = self._tree._unregister
-        for n in self._iter_post():
-            _unregister(n)  # type: ignore
+        if self._children:
+            self._tree._unregister_many(self._iter_post())  # type: ignore
         self._children = None
         return
 
@@ -897,7 +1140,7 @@ class Node(Generic[TData]):
         assert before is None
         if not self._children:
             raise ValueError("Need child nodes when `add_self=False`")
-        for child in self.children:
+        for child in self._children:
             n = target.add_child(child, before=None, deep=deep)
             res = res or n  # Return the first new node
         return res
@@ -912,71 +1155,116 @@ class Node(Generic[TData]):
         if predicate:
             return self._add_filtered(other, predicate)
 
-        assert not self._children
-        for child in other.children:
-            data_id = child._data_id if child._data_id != hash(child.data) else None
-            new_child = self.add_child(child.data, data_id=data_id)
-            if child.children:
-                # if child.has_children():
-                new_child._add_from(child, predicate=None)
+        if not other._children:
+            return
+        tree = self._tree
+        src_tree = other._tree
+        copy_child = self._copy_child
+        # If both trees calculate data_ids the same way, the source IDs are
+        # valid here too, so we neither call hash() to detect custom IDs nor
+        # let the target tree re-calculate them.
+        keep_ids = (
+            type(tree).calc_data_id is type(src_tree).calc_data_id
+            and tree._calc_data_id_hook is src_tree._calc_data_id_hook
+        )
+        # Iterative depth-first copy. We keep a stack of (source child iterator,
+        # target parent) pairs, so new nodes are created in pre-order (like the
+        # source) and we don't need a Python frame per level.
+        stack: list[tuple[Iterator[Self], Self]] = [(iter(other._children), self)]
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            src_iter, parent = stack[-1]
+            for child in src_iter:
+                new_child = copy_child(parent, child, keep_ids)
+                children = parent._children
+                if children is None:
+                    parent._children = [new_child]
+                else:
+                    children.append(new_child)
+                if child._children:
+                    push((iter(child._children), new_child))
+                    break
+            else:
+                pop()
         return
 
+    def _copy_child(self, parent: Self, child: Self, keep_ids: bool) -> Self:
+        """Create a copy of `child` (without descendants) as child of `parent`.
+
+        Called by :meth:`_add_from`, which appends the new node to
+        `parent._children`. Pass `keep_ids` if source and target tree
+        calculate data_ids the same way.
+        """
+        data = child._data
+        data_id = child._data_id
+        # (`hash()` always returns an int, so string IDs are custom)
+        if not keep_ids and isinstance(data_id, int) and data_id == hash(data):
+            data_id = None
+        # Bypass add_child(): we know `data` is neither a Node nor a Tree
+        return self._tree.node_factory(data, parent=parent, data_id=data_id)
+
     def _add_filtered(self, other: Self, predicate: PredicateCallbackType) -> None:
         """Append a filtered copy of `other` and its descendants as children.
 
         See also :ref:`iteration-callbacks`.
         """
-        # Stack of parent node objects 2-tuples (is_existing, node), used to
-        # create optional parents on demand.
-        # If existing, `node` references this tree. Otherwise, `node` references
-        # the `other` tree.
-        parent_stack: list[tuple[bool, Self]] = [(True, self)]
-
-        def _create_parents() -> Node[TData]:
+        children = other._children
+        if not children:
+            return
+        # Non-recursive: we keep a stack of [source node, target node, child
+        # iterator] frames. The target is None as long as the source node was
+        # not copied: parents are created on demand, i.e. only when a
+        # descendant is selected.
+        stack: list[list[Any]] = [[other, self, iter(children)]]
+        push = stack.append
+
+        def _create_parents() -> Self:
             """Materialize all virtual parents and return the last one."""
-            # print("_create_parents", parent_stack)
-            p = parent_stack[0][1]
-            for idx, (existing, n) in enumerate(parent_stack):
-                if existing:
-                    p = n
-                else:
-                    p = p.add(n)
-                    parent_stack[idx] = (True, p)
+            # Frames that already have a target are at the bottom of the stack
+            i = len(stack) - 1
+            while stack[i][1] is None:
+                i -= 1
+            p = stack[i][1]
+            for frame in stack[i + 1 :]:
+                p = p.add(frame[0])
+                frame[1] = p
             return p
 
-        def _visit(other: Self) -> None:
-            """Return True if any descendant returned True."""
-
-            # print("_visit", parent_stack, other)
-            for n in other.children:
-                parent_stack.append((False, n))
-
-                res = call_predicate(predicate, n)
-
-                if res is None or res is False:  # Add only if has a `true` descendant
-                    _visit(n)
-                elif res is True:  # Add this node (and also check children)
-                    _create_parents()
-                    _visit(n)
-                elif isinstance(res, SkipBranch):
-                    if res.and_self is False:
-                        # Add the node itself if user explicitly returned
-                        # `SkipBranch(and_self=False)`
-                        _create_parents()
-                elif isinstance(res, StopTraversal):
-                    raise res
-                elif isinstance(res, SelectBranch):
-                    # Unconditionally copy whole branch: no need to visit children
-                    p = _create_parents()
-                    p._add_from(n)
-                else:
-                    raise ValueError(f"Invalid predicate return value: {res}")
-
-                parent_stack.pop()
-            return
-
         try:
-            _visit(other)
+            while stack:
+                for n in stack[-1][2]:
+                    res = call_predicate(predicate, n)
+
+                    if res is None or res is False:
+                        # Add only if has a `true` descendant
+                        target = None
+                    elif res is True:  # Add this node (and also check children)
+                        target = _create_parents().add(n)
+                    else:
+                        # Compare the exact type first, which is cheaper than
+                        # `isinstance()` for the common case (no subclasses)
+                        t = type(res)
+                        if t is SkipBranch or isinstance(res, SkipBranch):
+                            if res.and_self is False:
+                                # Add the node itself if user explicitly returned
+                                # `SkipBranch(and_self=False)`
+                                _create_parents().add(n)
+                        elif t is StopTraversal or isinstance(res, StopTraversal):
+                            raise res
+                        elif t is SelectBranch or isinstance(res, SelectBranch):
+                            # Unconditionally copy whole branch: no need to visit
+                            # children
+                            _create_parents().add(n)._add_from(n)
+                        else:
+                            raise ValueError(f"Invalid predicate return value: {res}")
+                        continue
+
+                    if n._children:
+                        push([n, target, iter(n._children)])
+                        break
+                else:
+                    stack.pop()
         except StopTraversal:
             pass
         return
@@ -998,12 +1286,27 @@ class Node(Generic[TData]):
         if not predicate:
             raise ValueError("Predicate is required (use copy() instead)")
 
+        unregister_many = self._tree._unregister_many
+
+        def _remove(parent: Self, nodes: list[Self]) -> None:
+            """Remove `nodes` from `parent`'s child list in a single pass."""
+            drop_ids = {id(n) for n in nodes}
+            cl = [c for c in parent._children if id(c) not in drop_ids]  # type: ignore
+            parent._children = cl or None  # store None instead of `[]`
+            for n in nodes:
+                n.remove_children()
+            unregister_many(nodes)  # type: ignore
+            return
+
         def _visit(parent: Self) -> bool:
             """Return True if any descendant returned True."""
-            remove_nodes = []
+            children = parent._children
+            if not children:
+                return False
+            remove_nodes: list[Self] = []
             must_keep = False
 
-            for n in parent.children:
+            for n in children:
                 res = call_predicate(predicate, n)
                 if res is None or res is False:  # Keep only if has a `true` descendant
                     if _visit(n):
@@ -1013,22 +1316,26 @@ class Node(Generic[TData]):
                 elif res is True:  # Keep this node (and also check children)
                     _visit(n)
                     must_keep = True
-                elif isinstance(res, SelectBranch):
-                    # Unconditionally keep whole branch: no need to visit children
-                    must_keep = True
-                elif isinstance(res, SkipBranch):
-                    if res.and_self is False:
+                else:
+                    t = type(res)  # See `_add_filtered()`
+                    if t is SelectBranch or isinstance(res, SelectBranch):
+                        # Unconditionally keep whole branch: no need to visit
+                        # children
                         must_keep = True
-                        remove_nodes = n.children.copy()
-                    else:
-                        remove_nodes.append(n)
-                elif isinstance(res, StopTraversal):
-                    for n in remove_nodes:
-                        n.remove()
-                    raise res
-
-            for n in remove_nodes:
-                n.remove()
+                    elif t is SkipBranch or isinstance(res, SkipBranch):
+                        if res.and_self is False:
+                            # Keep the node itself, but drop its descendants
+                            must_keep = True
+                            n.remove_children()
+                        else:
+                            remove_nodes.append(n)
+                    elif t is StopTraversal or isinstance(res, StopTraversal):
+                        if remove_nodes:
+                            _remove(parent, remove_nodes)
+                        raise res
+
+            if remove_nodes:
+                _remove(parent, remove_nodes)
             return must_keep
 
         try:
@@ -1045,58 +1352,135 @@ class Node(Generic[TData]):
         # if mapper is None:
         #     mapper = self._tree.DEFAULT_DESERIALZATION_MAPPER
         assert not self._children
-        for item in obj:
-            if mapper:
-                # mapper may add item['data_id']
-                # data = mapper(parent=self, item=item)
-                data_obj = call_mapper(mapper, self, item)
-            else:
-                data_obj = item["data"]
+        # Non-recursive: we keep a stack of (parent node, child item iterator)
+        stack = [(self, iter(obj))]
+        while stack:
+            parent, items = stack[-1]
+            append_data = parent._append_data
+            for item in items:
+                if mapper:
+                    # mapper may add item['data_id']
+                    # data = mapper(parent=parent, item=item)
+                    data_obj = call_mapper(mapper, parent, item)
+                else:
+                    data_obj = item["data"]
 
-            child = self.append_child(
-                data_obj, data_id=item.get("data_id"), node_id=item.get("node_id")
-            )
-            child_items = item.get("children")
-            if child_items:
-                child.from_dict(child_items, mapper=mapper)
+                # Same as `parent.append_child()`, but skip the type dispatch
+                child = append_data(
+                    data_obj, data_id=item.get("data_id"), node_id=item.get("node_id")
+                )
+                child_items = item.get("children")
+                if child_items:
+                    stack.append((child, iter(child_items)))
+                    break
+            else:
+                stack.pop()
         return
 
     def _visit_pre(self, callback, memo) -> None:
-        """Depth-first, pre-order traversal."""
-        # Call callback and skip children if SkipBranch was returned.
-        # Also a StopTraversal(value) exception may be raised.
-        if call_traversal_cb(callback, self, memo) is False:
-            return
-
+        """Depth-first, pre-order traversal of all descendants."""
+        # Note that this is non-recursive: we keep a stack of child iterators.
         children = self._children
-        if children:
-            for c in children:
-                c._visit_pre(callback, memo)
+        if not children:
+            return
+        # We inline `call_traversal_cb()` in the loops below: most callbacks
+        # return None, so we only call the helpers for other results.
+        # Warnings are reported for the caller of `visit()` (stacklevel=3).
+        check_res = check_traversal_result
+        check_exc = check_traversal_exception
+        stack = [iter(children)]
+        push = stack.append
+        while stack:
+            for c in stack[-1]:
+                # Call callback and skip children if SkipBranch was returned.
+                # Also a StopTraversal(value) exception may be raised.
+                try:
+                    res = callback(c, memo)
+                except (SkipBranch, StopIteration) as e:
+                    check_exc(e, 3)
+                    continue
+                if res is not None and check_res(res, 3) is False:
+                    continue
+                if c._children:
+                    push(iter(c._children))
+                    break
+            else:
+                stack.pop()
         return
 
     def _visit_post(self, callback, memo) -> None:
-        """Depth-first, post-order traversal."""
+        """Depth-first, post-order traversal of all descendants."""
         # Callback may raise StopTraversal (also if callback returns false)
-        # but SkipBranch is not supported with post-order traversal
-        if self._children:
-            for c in self._children:
-                c._visit_post(callback, memo)
-        call_traversal_cb(callback, self, memo)
+        # but SkipBranch is not supported with post-order traversal.
+        # Note that this is non-recursive: we keep a stack of child iterators
+        # and a stack of the parents that are pending.
+        children = self._children
+        if not children:
+            return
+        # See `_visit_pre()`: `call_traversal_cb()` is inlined here
+        check_res = check_traversal_result
+        check_exc = check_traversal_exception
+        stack = [iter(children)]
+        push = stack.append
+        parents = []
+        while stack:
+            for c in stack[-1]:
+                if c._children:
+                    parents.append(c)
+                    push(iter(c._children))
+                    break
+                try:
+                    res = callback(c, memo)
+                except (SkipBranch, StopIteration) as e:
+                    check_exc(e, 3)
+                else:
+                    if res is not None:
+                        check_res(res, 3)
+            else:
+                stack.pop()
+                if parents:
+                    try:
+                        res = callback(parents.pop(), memo)
+                    except (SkipBranch, StopIteration) as e:
+                        check_exc(e, 3)
+                    else:
+                        if res is not None:
+                            check_res(res, 3)
+        return
 
     def _visit_level(self, callback, memo) -> None:
         """Breadth-first (aka level-order) traversal."""
-        # Note that this is non-recursive.
+        # Note that this is non-recursive: we use a FIFO queue.
         children = self._children
-        while children:
-            next_level = []
-            for c in children:
-                if call_traversal_cb(callback, c, memo) is False:
-                    continue
-                if c._children:
-                    next_level.extend(c._children)
-            children = next_level
+        if not children:
+            return
+        # See `_visit_pre()`: `call_traversal_cb()` is inlined here
+        check_res = check_traversal_result
+        check_exc = check_traversal_exception
+        queue = deque(children)
+        popleft = queue.popleft
+        extend = queue.extend
+        while queue:
+            c = popleft()
+            try:
+                res = callback(c, memo)
+            except (SkipBranch, StopIteration) as e:
+                check_exc(e, 3)
+                continue
+            if res is not None and check_res(res, 3) is False:
+                continue
+            if c._children:
+                extend(c._children)
         return
 
+    #: Map traversal methods to the names of their `visit()` implementations
+    #: (resolved with `getattr()`, so subclasses may override them)
+    _VISIT_DISPATCH = {
+        IterMethod.PRE_ORDER: "_visit_pre",
+        IterMethod.POST_ORDER: "_visit_post",
+        IterMethod.LEVEL_ORDER: "_visit_level",
+    }
+
     def visit(
         self,
         callback: TraversalCallbackType,
@@ -1130,63 +1514,97 @@ class Node(Generic[TData]):
                 If no `memo` argument is passed, an empty dict is created at
                 start, which has a life-span of the traversal only.
         """
-        try:
-            handler = getattr(self.__class__, f"_visit_{method.value}")
-        except AttributeError:
-            raise NotImplementedError(
-                f"Unsupported traversal method {method!r}."
-            ) from None
+        handler_name = self._VISIT_DISPATCH.get(method)
+        if handler_name is None:
+            raise NotImplementedError(f"Unsupported traversal method {method!r}.")
+        handler = getattr(self, handler_name)
 
         if memo is None:
             memo = {}
 
+        is_post = method is IterMethod.POST_ORDER
         try:
-            # Level-order is non-recursive
-            if method == IterMethod.LEVEL_ORDER:
-                if add_self:
-                    if call_traversal_cb(callback, self, memo) is False:
-                        return None
-                self._visit_level(callback, memo)
-                return None
-            # Otherwise pre- or post-order
-            if add_self and method != IterMethod.POST_ORDER:
+            if add_self and not is_post:
                 if call_traversal_cb(callback, self, memo) is False:
                     return None
 
-            for c in self.children:
-                handler(c, callback, memo)
+            handler(callback, memo)
 
-            if add_self and method == IterMethod.POST_ORDER:
-                if call_traversal_cb(callback, self, memo) is False:
-                    return None
+            if add_self and is_post:
+                call_traversal_cb(callback, self, memo)
         except StopTraversal as e:
             return e.value
         return None
 
     def _iter_pre(self) -> Iterator[Self]:
         """Depth-first, pre-order traversal."""
+        # Note that this is non-recursive: we keep a stack of child iterators.
         children = self._children
-        if children:
-            for c in children:
+        if not children:
+            return
+        stack = [iter(children)]
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            for c in stack[-1]:
                 yield c
-                yield from c._iter_pre()
+                cc = c._children
+                if cc:
+                    push(iter(cc))
+                    break
+            else:
+                pop()
         return
 
     def _iter_post(self) -> Iterator[Self]:
         """Depth-first, post-order traversal."""
-        for c in self.children:
-            yield from c._iter_post()
-            yield c
+        # Note that this is non-recursive: we keep a stack of child iterators
+        # and a stack of the parents that are pending.
+        children = self._children
+        if not children:
+            return
+        stack = [iter(children)]
+        push = stack.append
+        pop = stack.pop
+        parents = []
+        while stack:
+            for c in stack[-1]:
+                cc = c._children
+                if cc:
+                    parents.append(c)
+                    push(iter(cc))
+                    break
+                yield c
+            else:
+                pop()
+                if parents:
+                    yield parents.pop()
         return
 
     def _iter_level(self, *, revert=False, toggle=False) -> Iterator[Self]:
         """Breadth-first (aka level-order) traversal."""
         children = self._children
+        if not revert and not toggle:
+            # Plain left-to-right order: a single FIFO queue is sufficient
+            queue = deque(children or ())
+            popleft = queue.popleft
+            extend = queue.extend
+            while queue:
+                c = popleft()
+                yield c
+                cc = c._children
+                if cc:
+                    extend(cc)
+            return
+
+        # Reverse or alternating order: collect one level at a time
         while children:
             next_level = []
+            extend = next_level.extend
             for c in children:
-                if c._children:
-                    next_level.extend(c._children)
+                cc = c._children
+                if cc:
+                    extend(cc)
 
             if revert:
                 yield from reversed(children)
@@ -1212,24 +1630,33 @@ class Node(Generic[TData]):
         """ZigZag traversal, right-to-left."""
         return self._iter_level(revert=True, toggle=True)
 
+    #: Map traversal methods to the names of their `iterator()` implementations
+    #: (resolved with `getattr()`, so subclasses may override them)
+    _ITER_DISPATCH = {
+        IterMethod.PRE_ORDER: "_iter_pre",
+        IterMethod.POST_ORDER: "_iter_post",
+        IterMethod.LEVEL_ORDER: "_iter_level",
+        IterMethod.LEVEL_ORDER_RTL: "_iter_level_rtl",
+        IterMethod.ZIGZAG: "_iter_zigzag",
+        IterMethod.ZIGZAG_RTL: "_iter_zigzag_rtl",
+    }
+
     def iterator(
         self, method: IterMethod = IterMethod.PRE_ORDER, *, add_self=False
     ) -> Iterator[Self]:
-        """Generator that walks the hierarchy."""
-        try:
-            handler = getattr(self, f"_iter_{method.value}")
-        except AttributeError:
-            raise NotImplementedError(
-                f"Unsupported traversal method {method!r}."
-            ) from None
-
-        if add_self and method != IterMethod.POST_ORDER:
-            yield self
-
-        yield from handler()
-
-        if add_self and method == IterMethod.POST_ORDER:
-            yield self
+        """Return an iterator that walks the hierarchy."""
+        handler_name = self._ITER_DISPATCH.get(method)
+        if handler_name is None:
+            raise NotImplementedError(f"Unsupported traversal method {method!r}.")
+        handler = getattr(self, handler_name)
+
+        # Return the (non-recursive) traversal generator directly, instead of
+        # passing every node through another `yield from` level
+        if not add_self:
+            return handler()
+        if method is IterMethod.POST_ORDER:
+            return chain(handler(), (self,))
+        return chain((self,), handler())
 
     #: Implement ``for subnode in node: ...`` syntax to iterate descendant nodes.
     __iter__ = iterator
@@ -1244,24 +1671,25 @@ class Node(Generic[TData]):
         if callable(match):
             cb_match = match
         elif isinstance(match, str):
-            pattern = re.compile(pattern=match)
-            cb_match = lambda node: bool(pattern.fullmatch(node.name))  # noqa: E731
+            if match.isidentifier():
+                # No regex special characters: fullmatch() is a plain compare.
+                # (`f"{node._data}"` is the same as `node.name`, but without
+                # the property lookup.)
+                cb_match = lambda node: f"{node._data}" == match  # noqa: E731
+            else:
+                fullmatch = _compile_pattern(match).fullmatch
+                cb_match = lambda node: fullmatch(f"{node._data}")  # noqa: E731
         elif isinstance(match, (list, tuple)):
             assert len(match) == 2, match
-            pattern = re.compile(pattern=match[0], flags=match[1])
-            cb_match = lambda node: bool(pattern.fullmatch(node.name))  # noqa: E731
+            fullmatch = _compile_pattern(match[0], match[1]).fullmatch
+            cb_match = lambda node: fullmatch(f"{node._data}")  # noqa: E731
         else:
             cb_match = lambda node: node._data is match  # noqa: E731
 
-        count = 0
-        for node in self.iterator(add_self=add_self):
-            if not cb_match(node):
-                continue
-            count += 1
-            yield node
-            if max_results and count >= max_results:
-                break
-        return
+        res = filter(cb_match, self.iterator(add_self=add_self))
+        if max_results:
+            res = islice(res, max_results)
+        return res
 
     def find_all(
         self,
@@ -1274,6 +1702,9 @@ class Node(Generic[TData]):
     ) -> list[Self]:
         """Return a list of matching nodes (list may be empty).
 
+        Matches by `data` or `data_id` are looked up in the tree's index and
+        returned in the order they were added to the tree.
+
         See also :ref:`iteration-callbacks`.
         """
         if data:
@@ -1281,12 +1712,20 @@ class Node(Generic[TData]):
             data_id = self._tree.calc_data_id(data)
         if data_id:
             assert match is None
-            return [
-                n for n in self.iterator(add_self=add_self) if n._data_id == data_id
-            ]
-        return [
-            n for n in self._search(match, add_self=add_self, max_results=max_results)
-        ]
+            # Use the tree's index instead of walking the whole branch
+            candidates = self._tree._nodes_by_data_id.get(data_id)
+            if not candidates:
+                return []
+            if self._parent is None:  # System root: all nodes are descendants
+                return candidates[:max_results] if max_results else candidates.copy()
+            res = []
+            for n in candidates:
+                if n.is_descendant_of(self) or (add_self and n is self):
+                    res.append(n)
+                    if len(res) == max_results:
+                        break
+            return res
+        return list(self._search(match, add_self=add_self, max_results=max_results))
 
     def find_first(
         self,
@@ -1299,6 +1738,9 @@ class Node(Generic[TData]):
 
         See also :ref:`iteration-callbacks`.
         """
+        if match is not None and not data and not data_id:
+            # Stop at the first match without collecting a result list
+            return next(self._search(match), None)
         res = self.find_all(data, match=match, data_id=data_id, max_results=1)
         return res[0] if res else None
 
@@ -1318,51 +1760,22 @@ class Node(Generic[TData]):
             return
         if key is None:
             key = attrgetter("name")
-        cl.sort(key=key, reverse=reverse)
+        if len(cl) > 1:
+            cl.sort(key=key, reverse=reverse)
         if deep:
-            for c in cl:
-                c.sort_children(key=key, reverse=reverse, deep=True)
+            # Non-recursive: we keep a stack of child lists that still need
+            # to be visited. Each list is sorted independently, so the
+            # visiting order does not matter and leaves are never pushed.
+            stack = [cl]
+            while stack:
+                for n in stack.pop():
+                    cl = n._children
+                    if cl:
+                        if len(cl) > 1:
+                            cl.sort(key=key, reverse=reverse)
+                        stack.append(cl)
         return
 
-    def _get_prefix(self, style, lstrip) -> str:
-        if len(style) == 4:
-            s0, s1, s2, s3 = style
-            s4 = s2
-            s5 = s3
-        elif len(style) == 6:
-            s0, s1, s2, s3, s4, s5 = style
-        else:
-            raise ValueError(f"Invalid style {style!r}")
-
-        def _is_last(p) -> bool:
-            # Don't use `is_last_sibling()` which is overloaded by TypedNode
-            return p is p._parent._children[-1]
-
-        parts = []
-        depth = 0
-        for p in self.get_parent_list():
-            depth += 1
-            if depth <= lstrip:
-                continue
-            if _is_last(p):
-                parts.append(s0)  # "    "
-            else:
-                parts.append(s1)  # " |  "
-
-        if depth >= lstrip:
-            if self._children:
-                if _is_last(self):
-                    parts.append(s4)  # " ╰┬─ "
-                else:
-                    parts.append(s5)  # " ├┬─ "
-            else:
-                if _is_last(self):
-                    parts.append(s2)  # " ╰── "
-                else:
-                    parts.append(s3)  # " ├── "
-
-        return "".join(parts)
-
     def _render_lines(
         self, *, repr: ReprArgType | None = None, style=None, add_self=True
     ) -> Iterator[str]:
@@ -1374,30 +1787,80 @@ class Node(Generic[TData]):
                     f"Invalid style {style!r}. Expected: {'|'.join(CONNECTORS.keys())}"
                 ) from None
 
+        if len(style) == 4:
+            s0, s1, s2, s3 = style
+            s4 = s2
+            s5 = s3
+        elif len(style) == 6:
+            s0, s1, s2, s3, s4, s5 = style
+        else:
+            raise ValueError(f"Invalid style {style!r}")
+
         if repr is None:
             repr = self.DEFAULT_RENDER_REPR
+        if not callable(repr):
+            repr = _compile_repr(repr)
 
         # Find out if we need to strip some of the leftmost prefixes.
         # If this was called for a normal node, we strip all parent levels
         # (and also the own prefix when `add_self` is false).
         # If this was called for the system root node, we do the same, but we
         # never render self, because the title is rendered by the caller.
-        lstrip = self.depth()
-        if not add_self:
-            lstrip += 1
+        # `lstrip` is relative to this node, i.e. direct children have level 1.
+        lstrip = 0 if add_self else 1
         if not self._parent:
             add_self = False
 
-        for n in self.iterator(add_self=add_self):
-            prefix = n._get_prefix(style, lstrip)
+        if add_self:
+            # Own prefixes are always stripped
+            yield repr(self)
 
-            if callable(repr):
-                s = repr(n)
-            else:
-                s = repr.format(node=n)
+        children = self._children
+        if not children:
+            return
+
+        # Non-recursive pre-order traversal. Every stack entry holds the
+        # child iterator, the last child, the connector prefix of the parent
+        # levels, and the relative level of the children.
+        stack = [(iter(children), children[-1], "", 1)]
+        while stack:
+            child_iter, last, prefix, level = stack[-1]
+            for n in child_iter:
+                # Don't use `is_last_sibling()` which is overloaded by TypedNode
+                is_last = n is last
+                children = n._children
+                if level > lstrip:
+                    if children:
+                        own = s4 if is_last else s5  # " ╰┬─ " / " ├┬─ "
+                    else:
+                        own = s2 if is_last else s3  # " ╰── " / " ├── "
+                else:
+                    own = ""
+
+                yield prefix + own + repr(n)
 
-            yield prefix + s
+                if children:
+                    if level > lstrip:
+                        child_prefix = prefix + (s0 if is_last else s1)
+                    else:
+                        child_prefix = prefix
+                    stack.append(
+                        (iter(children), children[-1], child_prefix, level + 1)
+                    )
+                    break
+            else:
+                stack.pop()
+        return
 
+    def _render_list(
+        self, *, repr: ReprArgType | None = None, add_self=True
+    ) -> Iterator[str]:
+        if repr is None:
+            repr = self.DEFAULT_RENDER_REPR
+        if not callable(repr):
+            repr = _compile_repr(repr)
+        for n in self.iterator(add_self=add_self):
+            yield repr(n)
         return
 
     def format_iter(
@@ -1408,16 +1871,11 @@ class Node(Generic[TData]):
         add_self=True,
     ) -> Iterator[str]:
         """This variant of :meth:`format` returns a line generator."""
+        # Return the generators directly, so `format()` does not need to pass
+        # every line through an additional `yield from` level.
         if style == "list":
-            if repr is None:
-                repr = self.DEFAULT_RENDER_REPR
-            for n in self.iterator(add_self=add_self):
-                if callable(repr):
-                    yield repr(n)
-                else:
-                    yield repr.format(node=n)
-            return
-        yield from self._render_lines(repr=repr, style=style, add_self=add_self)
+            return self._render_list(repr=repr, add_self=add_self)
+        return self._render_lines(repr=repr, style=style, add_self=add_self)
 
     def format(
         self,
@@ -1455,42 +1913,60 @@ class Node(Generic[TData]):
 
     def to_dict(self, *, mapper: SerializeMapperType | None = None) -> dict:
         """Return a nested dict of this node and its children."""
-        res: dict = {
-            "data": str(self.data),
-        }
-        # Add custom data_id if not calculated to the hash by default.
-        if self._data_id != hash(self._data):
-            res["data_id"] = self._data_id
-        res = call_mapper(mapper, self, res)
-        # if mapper:
-        #     res = mapper(self, res)
-        if self._children:
-            res["children"] = cl = []
-            for n in self._children:
-                cl.append(n.to_dict(mapper=mapper))
+
+        def _make_entry(node: Self) -> dict:
+            data = node._data
+            res: dict = {
+                # Most trees store plain strings: skip the `str()` call for those
+                "data": data if data.__class__ is str else str(data),
+            }
+            # Add custom data_id if not calculated to the hash by default.
+            # (`hash()` always returns an int, so we can skip it for str IDs.)
+            data_id = node._data_id
+            if not isinstance(data_id, int) or data_id != hash(data):
+                res["data_id"] = data_id
+            if mapper is not None:
+                res = call_mapper(mapper, node, res)
+            return res
+
+        res = _make_entry(self)
+        if not self._children:
+            return res
+        # Non-recursive (like `from_dict()`): we keep a stack of
+        # (source child iterator, target children list) pairs
+        res["children"] = child_list = []
+        stack = [(iter(self._children), child_list)]
+        while stack:
+            nodes, child_list = stack[-1]
+            for n in nodes:
+                entry = _make_entry(n)
+                child_list.append(entry)
+                if n._children:
+                    entry["children"] = grand_list = []
+                    stack.append((iter(n._children), grand_list))
+                    break
+            else:
+                stack.pop()
         return res
 
     @classmethod
     def _compress_entry(
         cls, data: dict | str, key_map: KeyMapType, value_map: ValueDictMapType
-    ) -> None:
-        if isinstance(data, str):
-            return
-        for key, value in list(data.items()):
-            if key in key_map:
-                short_key = key_map[key]
-                data[short_key] = data.pop(key)
-            else:
-                short_key = key
-
-            if key in value_map:
-                data[short_key] = value_map[key][value]
-        return
+    ) -> dict | str:
+        """Return a copy of `data` with shortened keys and mapped values."""
+        if isinstance(data, str) or not (key_map or value_map):
+            return data
+        return {
+            key_map.get(key, key): value_map[key][value] if key in value_map else value
+            for key, value in data.items()
+        }
 
     @classmethod
     def _make_list_entry(cls, node: Self) -> dict[str, Any] | str:
         node_data = node._data
-        is_custom_id = node._data_id != hash(node_data)
+        data_id = node._data_id
+        # `hash()` always returns an int, so we can skip it for e.g. str IDs
+        is_custom_id = not isinstance(data_id, int) or data_id != hash(node_data)
 
         # If data is more complex than a simple string, or if we use a custom
         # data_id, we store data as a dict instead of a str:
@@ -1507,7 +1983,7 @@ class Node(Generic[TData]):
                 # "id": data_id,
             }
         # Add custom data_id if not calculated as hash by default.
-        if node._data_id != hash(node_data):
+        if is_custom_id:
             data["data_id"] = node._data_id
         return data
 
@@ -1524,11 +2000,11 @@ class Node(Generic[TData]):
         [(parent_key, data)]
         ```
         """
-        calc_id = self._tree.calc_data_id
         #: For nodes with multiple occurrences: index of the first one
+        clone_idx_map: dict[DataIdType, int] = {}
         #: For typed nodes, we must also check if the `kind` matches, before
         #: simply store a reference.
-        clone_idx_and_kind_map: dict[DataIdType, tuple[DataIdType, str | None]] = {}
+        clone_idx_and_kind_map: dict[DataIdType, tuple[int, str | None]] = {}
         parent_id_map = {self._node_id: 0}
 
         if mapper is None:
@@ -1548,44 +2024,73 @@ class Node(Generic[TData]):
             }
             # print("value_map", value_map)
 
+        # Only typed nodes have a `kind`: decide once instead of calling
+        # `getattr(node, "kind", None)` for every node.
+        has_kind = hasattr(self._tree.node_factory, "kind")
+        # Avoid attribute lookups inside the loop
+        clone_idx_get = clone_idx_map.get
+        clone_map_get = clone_idx_and_kind_map.get
+        nodes_by_data_id = self._tree._nodes_by_data_id
+        make_list_entry = self._make_list_entry
+        # `Node._make_list_entry()` stores plain strings (with default data_id)
+        # as-is, so we can skip the call for those. Subclasses (e.g. TypedNode)
+        # may always return a dict.
+        str_as_is = make_list_entry.__func__ is Node._make_list_entry.__func__
+        # Only call `_compress_entry()` if compression was requested
+        compress_entry = self._compress_entry if key_map or value_map else None
+
         for id_gen, node in enumerate(self, 1):
             # Compact mode: use integer sequence as keys
             # Store idx with original id for later parent-ref. We only have to
             # do this for nodes that have children though:
-            node_id = node._node_id
             if node._children:
-                parent_id_map[node_id] = id_gen
+                parent_id_map[node._node_id] = id_gen
 
-            parent_id = node._parent._node_id
-            parent_idx = parent_id_map[parent_id]
-
-            node_data = node._data
-            data_id = calc_id(node_data)
+            parent_idx = parent_id_map[node._parent._node_id]
 
             # If node is a 2nd occurrence of a clone, only store the index of the
-            # first occurrence and do not call the mapper
-            node_kind = getattr(node, "kind", None)
-
-            clone_idx, clone_kind = clone_idx_and_kind_map.get(data_id, (None, None))
-            if clone_idx:
-                if node_kind == clone_kind:
-                    yield (parent_idx, clone_idx)
-                    continue
-            elif node.is_clone():
-                # First instance of a clone node: take a note
-                clone_idx_and_kind_map[data_id] = (id_gen, node_kind)
+            # first occurrence and do not call the mapper.
+            # Clones share the same `_data_id`, so we can use it as key instead
+            # of re-calculating it from `node.data`. Most nodes are not clones,
+            # so check that first and only then look into the map.
+            data_id = node._data_id
+            if len(nodes_by_data_id[data_id]) > 1:  # node.is_clone()
+                if has_kind:
+                    node_kind = node.kind
+                    clone_idx, clone_kind = clone_map_get(data_id, (None, None))
+                    if clone_idx:
+                        if node_kind == clone_kind:
+                            yield (parent_idx, clone_idx)
+                            continue
+                    else:
+                        # First instance of a clone node: take a note
+                        clone_idx_and_kind_map[data_id] = (id_gen, node_kind)
+                else:
+                    # Plain nodes have no `kind`: just store the index
+                    clone_idx = clone_idx_get(data_id)
+                    if clone_idx:
+                        yield (parent_idx, clone_idx)
+                        continue
+                    clone_idx_map[data_id] = id_gen
+
+            # Fast path for the most common case: a plain string with default
+            # data_id is stored as-is (strings are neither mapped nor compressed)
+            node_data = node._data
+            if str_as_is and node_data.__class__ is str and data_id == hash(node_data):
+                yield (parent_idx, node_data)
+                continue
 
             # If node.data is more complex than a simple string, or if we use a
             # custom data_id, we store data as a dict instead of a str:
-            data = self._make_list_entry(node)
+            data = make_list_entry(node)
 
             # Let caller serialize custom data objects
             if mapper and isinstance(data, dict):
                 data = call_mapper(mapper, node, data)
 
-            # Compress data if requested
-            if key_map or value_map:
-                self._compress_entry(data, key_map, value_dict_map)
+            # Compress data if requested (plain strings are stored as-is)
+            if compress_entry and isinstance(data, dict):
+                data = compress_entry(data, key_map, value_dict_map)
 
             yield (parent_idx, data)
         return
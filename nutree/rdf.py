@@ -17,7 +17,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Callable, Union
 
-from nutree.common import IterationControl
+from nutree.common import IterationControl, has_kind
 
 if TYPE_CHECKING:  # Imported by type checkers, but prevent circular includes
     from nutree.node import Node
@@ -101,7 +101,7 @@ def _add_child_node(
         return False
 
     # Add standard attributes
-    if hasattr(tree_node, "kind"):
+    if has_kind(tree_node):
         graph.add((graph_node, NUTREE_NS.kind, Literal(tree_node.kind)))
     graph.add((graph_node, NUTREE_NS.name, Literal(tree_node.name)))
     if index >= 0:
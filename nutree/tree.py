@@ -16,6 +16,7 @@ import json
 import random
 import threading
 from collections.abc import Iterable, Iterator
+from itertools import chain
 from pathlib import Path
 from typing import (
     IO,
@@ -74,6 +75,22 @@ MIN_PYTHON_VERSION_INFO = (3, 8)
 check_python_version(MIN_PYTHON_VERSION_INFO)
 
 
+def _detach_node(node: Node, clear: bool) -> None:
+    """Null the tree links (and optionally the data) of an unregistered node."""
+    # Note: nulling the main attributes is not strictly neccessary, but
+    # helps to detect bugs when accessing nodes after they were removed.
+    # (We accept a violation of the type declarations in this case.)
+    node._tree = None  # type: ignore
+    node._parent = None  # type: ignore
+    node._depth = 0
+    if clear:
+        node._data = _DELETED_TAG
+        node._data_id = None  # type: ignore
+        node._node_id = None  # type: ignore
+        node._children = None
+        node._meta = None
+
+
 # ------------------------------------------------------------------------------
 # - _SystemRootNode
 # ------------------------------------------------------------------------------
@@ -86,6 +103,7 @@ class _SystemRootNode(Node):
         self._node_id = ROOT_NODE_ID
         self._data_id = ROOT_DATA_ID
         self._data = tree.name
+        self._depth = 0
         self._children = []
         self._meta = None
 
@@ -141,6 +159,10 @@ class Tree(Generic[TData, TNode]):
         self._calc_data_id_hook: CalcIdCallbackType | None = calc_data_id
         # Enable aliasing when accessing node instances.
         self._forward_attrs: bool = forward_attrs
+        # Bind hot methods once, so Node.__init__ does not have to resolve them
+        # for every new node (also picks up overloaded `calc_data_id()`):
+        self._calc_data_id = self.calc_data_id
+        self._register_bound = self._register
 
     def __repr__(self):
         return f"{self.__class__.__name__}<{self.name!r}>"
@@ -261,17 +283,35 @@ class Tree(Generic[TData, TNode]):
         if not clones:
             del self._nodes_by_data_id[node._data_id]
 
-        # Note: nulling the main attributes is not strictly neccessary, but
-        # helps to detect bugs when accessing nodes after they were removed.
-        # (We accept a violation of the type declarations in this case.)
-        node._tree = None  # type: ignore
-        node._parent = None  # type: ignore
-        if clear:
-            node._data = _DELETED_TAG
-            node._data_id = None  # type: ignore
-            node._node_id = None  # type: ignore
-            node._children = None
-            node._meta = None
+        _detach_node(node, clear)
+        return
+
+    def _unregister_many(self, nodes: Iterable[TNode], *, clear: bool = True) -> None:
+        """Unlink multiple nodes from this tree (see :meth:`_unregister`).
+
+        Clone lists are updated once per `data_id` after all nodes were
+        collected, instead of scanning and popping once per node.
+        """
+        node_by_id = self._node_by_id
+        # data_id -> set of id(node) for all nodes that are removed
+        drop_map: dict[DataIdType, set[int]] = {}
+        for node in nodes:
+            assert node._node_id in node_by_id, f"{node}"
+            del node_by_id[node._node_id]
+            drop_ids = drop_map.get(node._data_id)
+            if drop_ids is None:
+                drop_map[node._data_id] = {id(node)}
+            else:
+                drop_ids.add(id(node))
+            _detach_node(node, clear)
+
+        nodes_by_data_id = self._nodes_by_data_id
+        for data_id, drop_ids in drop_map.items():
+            clones = nodes_by_data_id[data_id]
+            if len(clones) == len(drop_ids):
+                del nodes_by_data_id[data_id]
+            else:
+                nodes_by_data_id[data_id] = [n for n in clones if id(n) not in drop_ids]
         return
 
     @property
@@ -354,8 +394,13 @@ class Tree(Generic[TData, TNode]):
                         if new_data:
                             n._data = new_data
                 else:
-                    # Move this one node to another slot in the map
-                    node_map[node._data_id].remove(node)
+                    # Move this one node to another slot in the map.
+                    # Note: `list.remove()` compares with `==`, which is true
+                    # for all clones, so we remove by identity:
+                    for i, n in enumerate(cur_nodes):
+                        if n is node:
+                            del cur_nodes[i]
+                            break
                     try:  # are we adding to existing clones again?
                         node_map[new_data_id].append(node)
                     except KeyError:  # now a singleton with a new data_id
@@ -438,11 +483,11 @@ class Tree(Generic[TData, TNode]):
         See Node's :meth:`~nutree.node.Node.iterator` method for details.
         """
         if method == IterMethod.UNORDERED:
-            return (n for n in self._node_by_id.values())
+            return iter(self._node_by_id.values())
         elif method == IterMethod.RANDOM_ORDER:
             values = list(self._node_by_id.values())
             random.shuffle(values)
-            return (n for n in values)
+            return iter(values)
         return self.system_root.iterator(method=method)
 
     #: Implement ``for node in tree: ...`` syntax to iterate nodes depth-first.
@@ -454,12 +499,12 @@ class Tree(Generic[TData, TNode]):
         """This variant of :meth:`format` returns a line generator."""
         if title is None:
             title = False if style == "list" else True
-        if title:
-            yield f"{self}" if title is True else f"{title}"
         has_title = title is not False
-        yield from self.system_root.format_iter(
-            repr=repr, style=style, add_self=has_title
-        )
+        lines = self.system_root.format_iter(repr=repr, style=style, add_self=has_title)
+        if not title:
+            return lines
+        # Prepend the title instead of passing all lines through `yield from`
+        return chain((f"{self}" if title is True else f"{title}",), lines)
 
     def format(
         self,
@@ -610,7 +655,8 @@ class Tree(Generic[TData, TNode]):
             assert match is None
             res = self._nodes_by_data_id.get(data_id)
             if res:
-                return res[max_results:] if max_results else res
+                # Return a copy, so callers cannot modify the index
+                return res[:max_results] if max_results else res.copy()
             return []
 
         elif match is not None:
@@ -689,7 +735,8 @@ class Tree(Generic[TData, TNode]):
         value_map: ValueMapType | None = None,
     ) -> Iterator[tuple[DataIdType, Union[FlatJsonDictType, str, int]]]:
         """Yield a parent-referencing list of child nodes."""
-        yield from self.system_root.to_list_iter(
+        # Return the generator directly instead of delegating with `yield from`
+        return self.system_root.to_list_iter(
             mapper=mapper, key_map=key_map, value_map=value_map
         )
 
@@ -1025,6 +1072,7 @@ class Tree(Generic[TData, TNode]):
             assert (
                 node._children is None or len(node._children) > 0
             ), f"{node}: {node._children}"
+            assert node._depth == node._parent._depth + 1, node  # type: ignore
 
         assert len(self._node_by_id) == len(node_list)
 
@@ -34,6 +34,7 @@ from nutree.common import (
     UniqueConstraintError,
     ValueMapType,
     call_mapper,
+    normalize_before,
 )
 from nutree.node import Node, TData
 from nutree.tree import Tree
@@ -147,13 +148,13 @@ class TypedNode(Node[TData]):
         """Return a list of all sibling entries of self (excluding self) if any."""
         if any_kind:
             return super().get_siblings(add_self=add_self)
-        children = self._parent.children
-        rel = self.kind
-        return [n for n in children if (add_self or n is not self) and n.kind == rel]
+        children: list[Self] = self._parent._children  # type: ignore
+        rel = self._kind
+        return [n for n in children if (add_self or n is not self) and n._kind == rel]
 
     def first_sibling(self, *, any_kind=False) -> Self:
         """Return first sibling `of the same kind` (may be self)."""
-        pc = self._parent.children
+        pc: list[Self] = self._parent._children  # type: ignore
         if any_kind:
             return pc[0]
         for n in pc:
@@ -163,7 +164,7 @@ class TypedNode(Node[TData]):
 
     def last_sibling(self, *, any_kind=False) -> Self:
         """Return last sibling `of the same kind` (may be self)."""
-        pc = self._parent.children
+        pc: list[Self] = self._parent._children  # type: ignore
         if any_kind:
             return pc[-1]
         for n in reversed(pc):
@@ -173,8 +174,8 @@ class TypedNode(Node[TData]):
 
     def prev_sibling(self, *, any_kind=False) -> Self | None:
         """Return predecessor `of the same kind` or None if node is first sibling."""
-        pc = self._parent.children
-        own_idx = pc.index(self)
+        pc: list[Self] = self._parent._children  # type: ignore
+        own_idx = self._sibling_index()
         if own_idx > 0:
             for idx in range(own_idx - 1, -1, -1):
                 n = pc[idx]
@@ -184,11 +185,11 @@ class TypedNode(Node[TData]):
 
     def next_sibling(self, *, any_kind=False) -> Self | None:
         """Return successor `of the same kind` or None if node is last sibling."""
-        pc = self._parent.children
+        pc: list[Self] = self._parent._children  # type: ignore
         pc_len = len(pc)
-        own_idx = pc.index(self)
+        own_idx = self._sibling_index()
 
-        if own_idx < pc_len - 2:
+        if own_idx < pc_len - 1:
             for idx in range(own_idx + 1, pc_len):
                 n = pc[idx]
                 if any_kind or n._kind == self._kind:
@@ -198,41 +199,38 @@ class TypedNode(Node[TData]):
     def get_index(self, *, any_kind=False) -> int:
         """Return index in sibling list."""
         if any_kind:
-            kc = self._parent.children
-        else:
-            kc = self._parent.get_children(self.kind)
-        return kc.index(cast(Self, self))
+            return self._sibling_index()
+        # Count preceding siblings of the same kind (compare by identity and
+        # don't build a filtered list)
+        kind = self._kind
+        idx = 0
+        for n in self._parent._children:  # type: ignore
+            if n is self:
+                return idx
+            if n._kind == kind:
+                idx += 1
+        raise ValueError(f"{self} is not a child of {self._parent}")
 
     def is_first_sibling(self, *, any_kind=False) -> bool:
         """Return true if this node is the first sibling, i.e. the first child
         of its parent."""
         if any_kind:
-            return self is self._parent.children[0]
+            return self is self._parent._children[0]  # type: ignore
         return self is self.first_sibling(any_kind=False)
 
     def is_last_sibling(self, *, any_kind=False) -> bool:
         """Return true if this node is the last sibling, i.e. the last child
         **of this kind** of its parent."""
         if any_kind:
-            return self is self._parent.children[-1]
+            return self is self._parent._children[-1]  # type: ignore
         return self is self.last_sibling(any_kind=False)
 
-    def _add_from(
-        self, other: Self, *, predicate: PredicateCallbackType | None = None
-    ) -> None:
-        """Append copies of all source descendants to self.
-
-        See also :ref:`iteration-callbacks`.
-        """
-        if predicate:
-            return self._add_filtered(other, predicate)
-
-        assert not self._children
-        for child in other.children:
-            new_child = self.add_child(child.data, kind=None, data_id=child._data_id)
-            if child.children:
-                new_child._add_from(child, predicate=None)
-        return
+    def _copy_child(self, parent: Self, child: Self, keep_ids: bool) -> Self:
+        """Create a copy of `child` with the same `kind` (see
+        :meth:`Node._copy_child`)."""
+        return self._tree.node_factory(  # type: ignore
+            child._kind, child._data, parent=parent, data_id=child._data_id
+        )
 
     def add_child(
         self,
@@ -262,6 +260,8 @@ class TypedNode(Node[TData]):
             else:
                 kind = cast(TypedTree, self._tree).DEFAULT_CHILD_TYPE
 
+        before = normalize_before(before)
+
         if isinstance(child, (Node, Tree)) and not isinstance(
             child, (TypedNode, TypedTree)
         ):
@@ -270,16 +270,14 @@ class TypedNode(Node[TData]):
         if isinstance(child, TypedTree):
             if deep is None:
                 deep = True
-            topnodes = cast(list[Self], child.system_root.children)
-            if isinstance(before, (int, Node)) or before is True:
-                topnodes.reverse()
-            for n in topnodes:
-                self.add_child(
-                    n,
-                    kind=n.kind,
-                    before=before,
-                    deep=deep,
-                )
+            self._add_tree(
+                child,
+                before=before,
+                deep=deep,
+                add_node=lambda n: self.add_child(
+                    n, kind=n._kind, before=before, deep=deep
+                ),
+            )
             return child.system_root  # type: ignore
 
         source_node: Self = None  # type: ignore
@@ -301,6 +299,8 @@ class TypedNode(Node[TData]):
                 pass
             if data_id and data_id != source_node._data_id:
                 raise UniqueConstraintError(f"data_id conflict: {source_node}")
+            if deep and (self is source_node or self.is_descendant_of(source_node)):
+                raise ValueError(f"Cannot add a deep copy of {source_node} to itself.")
 
             # If creating an inherited node, use the parent class as constructor
             new_node = factory(
@@ -325,6 +325,8 @@ class TypedNode(Node[TData]):
         if children is None:
             assert before in (None, True, int, False)
             self._children = [new_node]
+        elif before is None:  # append (most common case)
+            children.append(new_node)
         elif before is True:  # prepend
             children.insert(0, new_node)
         elif isinstance(before, int):
@@ -335,8 +337,7 @@ class TypedNode(Node[TData]):
                     f"`before=node` ({before._parent}) "
                     f"must be a child of target node ({self})"
                 )
-            idx = children.index(before)  # raises ValueError
-            children.insert(idx, new_node)
+            children.insert(before._sibling_index(), new_node)
         else:
             children.append(new_node)
 
@@ -533,6 +534,7 @@ class _SystemRootTypedNode(TypedNode):
         self._node_id = ROOT_NODE_ID
         self._data_id = ROOT_DATA_ID
         self._data = tree.name
+        self._depth = 0
         self._children = []
         self._meta = None
         self._kind = None  # type: ignore
@@ -70,9 +70,22 @@ class TestClones:
         assert res[0].data == res[1].data  # node.data is equal
         assert res[0].data is res[1].data  # and identical
 
+        assert len(tree.find_all("a1", max_results=1)) == 1
+        assert tree.find_all("a1", max_results=1)[0] is res[0]
+        assert tree["B"].find_all("a1", max_results=1)[0] is res[1]
+
         res = tree.find_all("not_existing")
         assert res == []
 
+        # Node.find_all() only returns matches inside the branch
+        res = tree["B"].find_all("a1")
+        assert len(res) == 1
+        assert res[0].parent is tree["B"]
+        assert tree["b1"].find_all("a1") == []
+        assert tree.system_root.find_all("a1") == tree.find_all("a1")
+        assert tree["A"].find_all("A") == []
+        assert tree["A"].find_all("A", add_self=True) == [tree["A"]]
+
         assert tree._self_check()
 
     def test_clones_typed(self):
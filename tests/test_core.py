@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 import re
+import sys
 from typing import Any
 
 import pytest
@@ -220,6 +221,7 @@ class TestNavigate:
         assert len(records.get_siblings()) == 1
         assert len(records.get_siblings(add_self=True)) == 2
         assert len(records.get_siblings(add_self=False)) == 1
+        assert records.get_siblings(add_self=True) is not tree.children
 
         # assert tree.last_child() is tree["The Little Prince"]
 
@@ -241,6 +243,7 @@ class TestNavigate:
 
         assert let_it_be.get_path(repr="{node.data}") == "/Records/Let It Be"
         assert let_it_be.get_path(repr="{node.data}", add_self=False) == "/Records"
+        assert records.get_path(add_self=False) == "/"
 
         assert let_it_be.get_top() is records
 
@@ -274,6 +277,15 @@ class TestNavigate:
         assert tree["A"].calc_depth() == 1
         assert tree["A"].calc_height() == 2
 
+        # Depths are cached, but must follow structural changes
+        a11 = tree["a11"]
+        assert a11.calc_depth() == 3
+        tree["a1"].move_to(tree["b1"])
+        assert a11.calc_depth() == 4
+        assert tree["b11"].calc_depth() == 3
+        tree["a1"].move_to(tree)
+        assert a11.calc_depth() == 2
+
     def test_relations(self):
         """
         Tree<'fixture'>
@@ -301,6 +313,8 @@ class TestNavigate:
         assert not tree["a1"].is_descendant_of(tree["a1"])
         assert not tree["a1"].is_descendant_of(tree["a11"])
         assert not tree["B"].is_descendant_of(tree["a11"])
+        assert not tree["b11"].is_descendant_of(tree["a1"])
+        assert not tree["a1"].is_descendant_of(tree.system_root)
 
         assert tree["a1"].is_ancestor_of(tree["a12"])
         assert tree["B"].is_ancestor_of(tree["b11"])
@@ -308,6 +322,8 @@ class TestNavigate:
 
         assert tree["a11"].get_common_ancestor(tree["a2"]) is tree["A"]
         assert tree["b11"].get_common_ancestor(tree["a11"]) is None
+        assert tree["a11"].get_common_ancestor(tree["a1"]) is tree["a1"]
+        assert tree["a1"].get_common_ancestor(tree["a1"]) is tree["a1"]
 
         assert tree["a11"].get_index() == 0
         assert tree["a12"].get_index() == 1
@@ -520,6 +536,29 @@ class TestFormat:
             "/A,/A/a1,/A/a1/a11,/A/a1/a12,/A/a2,/B,/B/b1,/B/b1/b11",
         )
 
+    def test_format_repr_template(self):
+        tree = fixture.create_tree_simple()
+        a = tree["a11"]
+        # Compiled templates must behave like `str.format()`
+        for template in (
+            "{node.data!r}",
+            "{{node}} '{node.name:>5}' \\ \"{node.parent.data!s:*^7}\"",
+            "{node.data[0]}",
+            "{node}",
+        ):
+            assert a.format(repr=template) == template.format(node=a)
+        with pytest.raises(IndexError):
+            a.format(repr="{}")
+
+        # Attribute names that are Python keywords are valid in templates
+        class Item:
+            def __init__(self, name):
+                setattr(self, "from", name)
+
+        node = tree.add(Item("x"))
+        assert node.format(repr="{node.data.from}") == "x"
+        assert node.get_path(repr="{node.data.from}") == "/x"
+
 
 class TestTraversal:
     def test_iter(self):
@@ -565,6 +604,58 @@ class TestTraversal:
         s = [n.data for n in tree.iterator(IterMethod.RANDOM_ORDER)]
         assert len(s) == 8
 
+    def test_iter_override(self):
+        # Node subclasses may override the traversal implementations
+        class MyNode(Node):
+            def _iter_pre(self):
+                return (n for n in super()._iter_pre() if n.name != "a11")
+
+            def _visit_level(self, callback, memo):
+                memo["level"] = True
+
+        class MyTree(Tree):
+            node_factory = MyNode
+
+        tree = MyTree()
+        tree.add("A").add("a1").add("a11").up().add("a12")
+        a = tree["A"]
+        assert isinstance(a, MyNode)
+        assert [n.name for n in a] == ["a1", "a12"]
+        assert [n.name for n in a.iterator(add_self=True)] == ["A", "a1", "a12"]
+        memo = {}
+        a.visit(lambda n, m: None, method=IterMethod.LEVEL_ORDER, memo=memo)
+        assert memo == {"level": True}
+
+    def test_iter_deep(self):
+        """Traversal is not limited by the Python recursion limit."""
+        depth = sys.getrecursionlimit() + 100
+        tree = Tree()
+        n = tree.add(0)
+        for i in range(1, depth):
+            n = n.add(i)
+
+        assert [n.data for n in tree] == list(range(depth))
+        assert [n.data for n in tree.iterator(IterMethod.POST_ORDER)] == list(
+            reversed(range(depth))
+        )
+
+        res = []
+        tree.visit(lambda node, memo: res.append(node.data))
+        assert res == list(range(depth))
+
+        res = []
+        tree.visit(
+            lambda node, memo: res.append(node.data), method=IterMethod.POST_ORDER
+        )
+        assert res == list(reversed(range(depth)))
+
+        assert tree.calc_height() == depth
+
+        # Only the deepest node matches: all parents are created on demand
+        tree_2 = tree.filtered(lambda node: node.data == depth - 1)
+        assert tree_2.count == depth
+        assert tree_2.calc_height() == depth
+
     def test_visit(self):
         """
         Tree<'fixture'>
@@ -650,6 +741,12 @@ class TestTraversal:
 
         assert ",".join(res) == "A,a1,a11,a12"
 
+        # The warning points to the code that called `visit()`
+        for method in (IterMethod.PRE_ORDER, IterMethod.POST_ORDER):
+            with pytest.warns(RuntimeWarning) as record:
+                tree["A"].visit(cb, method=method)
+            assert record[0].filename == __file__
+
         res = []
 
         def cb(node: Node, memo: Any):
@@ -721,6 +818,44 @@ class TestMutate:
             """,
         )
 
+    def test_add_before_node_uses_identity(self):
+        class Item:
+            def __init__(self, name):
+                self.name = name
+
+            def __str__(self):
+                return self.name
+
+            def __eq__(self, other):
+                raise AssertionError("__eq__ must not be called")
+
+            __hash__ = object.__hash__
+
+        tree = Tree()
+        a, b, c = Item("a"), Item("b"), Item("c")
+        tree.add(a)
+        n_c = tree.add(c)
+        tree.add(b, before=n_c)
+        tree.first_child().move_to(tree, before=n_c)
+
+        assert [str(n.data) for n in tree.children] == ["b", "a", "c"]
+
+    def test_add_before_false(self):
+        # `before=False` appends (although `False` is also an `int`)
+        tree = fixture.create_tree_simple()
+        tree["A"].add("a3", before=False)
+        tree["A"].add(tree["b11"], before=False)
+        tree.add(_make_tree_2(), before=False)
+        assert [n.name for n in tree["A"].children] == ["a1", "a2", "a3", "b11"]
+        assert [n.name for n in tree.children] == ["A", "B", "x"]
+
+    def test_move_before_false(self):
+        tree = fixture.create_tree_simple()
+        tree["b11"].move_to(tree["A"], before=False)
+        tree["a11"].move_to(tree["A"], before=False)
+        assert [n.name for n in tree["A"].children] == ["a1", "a2", "b11", "a11"]
+        assert tree._self_check()
+
     def test_add_tree(self):
         tree = fixture.create_tree_simple()
 
@@ -814,6 +949,15 @@ class TestMutate:
         )
         assert tree._self_check()
 
+        # Only rename the second occurrence (the bookkeeping must not unlink
+        # the other clone, although both compare equal)
+        tree = fixture.create_tree_simple()
+        a1_b = tree["B"].prepend_child("a1")
+        a1_b.set_data("new_a1", with_clones=False)
+        assert tree["a1"].parent is tree["A"]
+        assert tree["new_a1"] is a1_b
+        assert tree._self_check()
+
         # Reset tree
         tree = fixture.create_tree_simple()
         tree["B"].prepend_child("a1")
@@ -916,6 +1060,42 @@ class TestMutate:
             """,
         )
 
+        # Inserting a whole tree keeps the order of its toplevel nodes and
+        # does not modify the source tree
+        tree_3 = fixture.create_tree_simple()
+        b1 = tree_3["b1"]
+        a2 = tree_3["a2"]
+        b1.add(tree, before=0)
+        a2.add(tree)
+        assert [n.name for n in tree.children] == ["A", "B"]
+        assert [n.name for n in b1.children] == ["A", "B", "b11"]
+        assert [n.name for n in a2.children] == ["A", "B"]
+        assert a2.count_descendants() == tree.count
+        assert tree_3._self_check()
+
+        # Copies keep the data_ids of the source nodes
+        tree = Tree(calc_data_id=lambda tree, data: data.upper())
+        tree.add("a").add("b", data_id="custom")
+        tree_2 = tree.copy()
+        assert [n.data_id for n in tree_2] == ["A", "custom"]
+        tree_3 = tree_2.copy()
+        assert [n.data_id for n in tree_3] == ["A", "custom"]
+        tree_3 = Tree()
+        tree_3.add("c").add("d", data_id="custom")
+        tree_4 = tree_3.copy()
+        tree_3.add("e").add(tree_4)
+        assert [n.data_id for n in tree_3["e"]] == [hash("c"), "custom"]
+        assert tree_3._self_check()
+
+        # A deep copy cannot be added to the source node or its descendants
+        tree = fixture.create_tree_simple()
+        with pytest.raises(ValueError, match="deep copy"):
+            tree["a1"].add(tree["A"], deep=True)
+        with pytest.raises(ValueError, match="deep copy"):
+            tree["a1"].add(tree["a1"], deep=True)
+        tree["a1"].add(tree["B"], deep=True)
+        assert tree._self_check()
+
     def test_remove(self):
         """
         Tree<'fixture'>
@@ -936,7 +1116,10 @@ class TestMutate:
 
         tree["a1"].remove(keep_children=True)
 
+        b1 = tree["b1"]
         del tree["b1"]
+        # Removed nodes are detached
+        assert b1.depth() == 0
 
         assert fixture.check_content(
             tree,
@@ -962,6 +1145,13 @@ class TestMutate:
         print(tree.format(repr="{node.data}"))
         assert tree._self_check()
 
+        # Children are moved up into the position of the removed node
+        tree = fixture.create_tree_simple()
+        tree["a1"].remove(keep_children=True)
+        assert [n.name for n in tree["A"].children] == ["a11", "a12", "a2"]
+        assert tree["a11"].depth() == 2
+        assert tree._self_check()
+
         # --- with_clones
         tree = fixture.create_tree_simple(clones=True)
 
@@ -1101,6 +1291,15 @@ class TestMutate:
         with pytest.raises(NotImplementedError):
             tree["b1"].move_to(target_tree)
 
+        # Siblings with equal data (but different data_ids) are not mixed up
+        a = tree["A"]
+        x1 = a.add("x", data_id="x1")
+        x2 = a.add("x", data_id="x2")
+        x2.move_to(tree["B"])
+        assert a.children[-1] is x1
+        assert tree["B"].children == [x2]
+        assert tree._self_check()
+
 
 class TestCopy:
     def test_node_copy(self):
@@ -1419,6 +1618,20 @@ class TestCopy:
             """,
         )
 
+        def pred(node):
+            if node.name == "B":
+                return SkipBranch(and_self=False)
+            return False
+
+        # Previous siblings that were dropped, must still be dropped
+        _tf(
+            predicate=pred,
+            result="""
+            Tree<'fixture'>
+            ╰── B
+            """,
+        )
+
     def test_filtered(self):
         """
         Tree<'fixture'>
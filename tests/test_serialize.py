@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import json
 import pprint
+import sys
 import tempfile
 import zipfile
 from typing import Any
@@ -81,6 +82,11 @@ class TestSerialize:
         assert tree._self_check()
         assert tree_2._self_check()
 
+        # Same data with a custom data_id is not a reference to the clone
+        tree["b11"].add("a11", data_id="custom")
+        entries = list(tree.to_list_iter())
+        assert entries[-1][1] == {"str": "a11", "data_id": "custom"}
+
     def test_serialize_compressed(self):
         tree = fixture.create_tree_simple()
         tree.add_child("äöüß: \u00e4\u00f6\u00fc\u00df")
@@ -632,6 +638,12 @@ class TestToDictList:
         assert isinstance(d[0]["data"], str)
         # assert "kind" in l[0]
 
+        # Custom str IDs are stored without hashing the data
+        tree = Tree()
+        tree.add({"a": 1}, data_id="id1")
+        assert tree.to_dict_list() == [{"data": "{'a': 1}", "data_id": "id1"}]
+        assert list(tree.to_list_iter()) == [(0, {"data_id": "id1"})]
+
     def test_serialize_to_dict_list(self):
         tree = fixture.create_tree_simple()
 
@@ -673,6 +685,19 @@ class TestFromDict:
         assert tree._self_check()
         assert tree_2._self_check()
 
+        # Nesting deeper than the recursion limit
+        depth = sys.getrecursionlimit() + 100
+        obj: list[dict] = []
+        parent_list = obj
+        for i in range(depth):
+            item = {"data": f"n{i}", "children": []}
+            parent_list.append(item)
+            parent_list = item["children"]
+        tree_3 = Tree.from_dict(obj)
+        assert tree_3.count == depth
+        assert Tree.from_dict(tree_3.to_dict_list()).count == depth
+        assert tree_3.find("n5").parent.data == "n4"
+
     def test_from_dict_objects(self):
         """Save/load an object tree with to_dict_list and from_dict"""
 
@@ -120,6 +120,9 @@ class TestTypedTree:
         assert cause1.next_sibling(any_kind=True) is cause2
         assert cause2.next_sibling() is None
         assert cause2.next_sibling(any_kind=True) is eff1
+        assert eff1.next_sibling() is eff2
+        assert eff1.next_sibling(any_kind=True) is eff2
+        assert eff2.next_sibling(any_kind=True) is None
 
         assert eff1.is_first_sibling()
         assert not eff1.is_first_sibling(any_kind=True)
@@ -142,6 +145,10 @@ class TestTypedTree:
 
         subtree = func2.copy()
         assert isinstance(subtree, TypedTree)
+        # Copies keep the `kind` of all descendants
+        assert [n.kind for n in subtree] == [
+            n.kind for n in func2.iterator(add_self=True)
+        ]
 
     def test_add_child_2(self):
         tree = TypedTree("fixture")